@@ -17,7 +17,7 @@ import { SafetyInfoDialog } from "./SafetyInfoDialog";
 // Import data and utilities
 import { parseDoseString } from "../lib/dose-parser";
 import { addDose, getDoses } from "../lib/db";
-import { ADMINISTRATION_METHODS, DoseEntry } from "../lib/constants";
+import { ADMINISTRATION_METHODS, DoseEntry, ROUTE_NAME_SET } from "../lib/constants";
 import { analyzeDoseTier } from "../lib/dose-tiers.types";
 import { getSubstanceSafetyInfo } from "../lib/substance-safety";
 import { analyzePersonalPatterns } from "../lib/analysis";
@@ -1080,12 +1080,7 @@ export function DoseForm() {
       form.setValue("doseString", newValue);
       
       // Check if this is a valid exact route match
-      const isExactRouteMatch = Object.values(ADMINISTRATION_METHODS)
-        .flat()
-        .some(route => 
-          !route.startsWith("@") && 
-          route.toLowerCase() === suggestion.text.toLowerCase()
-        );
+      const isExactRouteMatch = ROUTE_NAME_SET.has(suggestion.text.toLowerCase());
         
       if (isExactRouteMatch) {
         console.log("Applied exact route match:", suggestion.text);
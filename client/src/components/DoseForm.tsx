@@ -25,9 +25,13 @@ import { SafetyInfoDialog } from "./SafetyInfoDialog";
 import { SubstanceDetailDialog } from "./SubstanceDetailDialog";
 
 // Import data and utilities
-import { parseDoseString } from "../lib/dose-parser";
+import { safeParseDoseString } from "../lib/dose-parser";
 import { addDose, getDoses } from "../lib/db";
-import { ADMINISTRATION_METHODS, DoseEntry } from "../lib/constants";
+import {
+  ADMINISTRATION_METHODS,
+  DoseEntry,
+  ROUTE_NAME_SET,
+} from "../lib/constants";
 import { analyzeDoseTier } from "../lib/dose-tiers.types";
 import {
   getSubstanceSafetyInfo,
@@ -200,8 +204,11 @@ function fuzzyMatch(query: string, substance: string): number {
 }
 
 // Get detailed error information based on the error and input
-function getErrorDetails(error: Error, input: string): ParseError | null {
-  const message = error.message.toLowerCase();
+function getErrorDetails(
+  errorMessage: string,
+  input: string,
+): ParseError | null {
+  const message = errorMessage.toLowerCase();
   const words = input.trim().split(/\s+/);
 
   // Don't show errors while user is still typing if following valid patterns
@@ -702,13 +709,9 @@ function useDoseParsing(doseString: string) {
       // Check if the third word (route) is a complete, valid route
       // This prevents parsing with partial route matches
       const potentialRoute = words[2].toLowerCase();
-      const validRoutes = Object.values(ADMINISTRATION_METHODS)
-        .flat()
-        .filter((r) => !r.startsWith("@"))
-        .map((r) => r.toLowerCase());
 
       // Only proceed if the route is complete and valid
-      const isExactRouteMatch = validRoutes.includes(potentialRoute);
+      const isExactRouteMatch = ROUTE_NAME_SET.has(potentialRoute);
 
       if (!isExactRouteMatch) {
         // Don't parse if the route isn't a complete match
@@ -718,8 +721,17 @@ function useDoseParsing(doseString: string) {
         return;
       }
 
-      // Try to parse the dose string
-      const parsed = parseDoseString(doseString);
+      // Try to parse the dose string. The safe variant reports failures as a
+      // value, so invalid input doesn't throw on every keystroke.
+      const result = safeParseDoseString(doseString);
+      if (!result.success) {
+        setParseError(getErrorDetails(result.error, doseString));
+        setPreviewParse(null);
+        setTierAnalysis(null);
+        return;
+      }
+
+      const parsed = result.data;
       setPreviewParse(parsed);
 
       console.log("Successfully parsed dose:", parsed);
@@ -756,7 +768,7 @@ function useDoseParsing(doseString: string) {
     } catch (error: any) {
       // Only show error details if the dose string has content
       if (doseString.trim()) {
-        const errorDetails = getErrorDetails(error, doseString);
+        const errorDetails = getErrorDetails(error.message, doseString);
         setParseError(errorDetails);
       } else {
         setParseError(null);
@@ -1231,14 +1243,14 @@ export function DoseForm() {
       console.log("Added route, completing dose:", newValue);
 
       // Immediately try to parse the dose to update the UI
-      try {
-        const parsed = parseDoseString(newValue);
-        console.log("Auto-parsed dose after route selection:", parsed);
+      const result = safeParseDoseString(newValue);
+      if (result.success) {
+        console.log("Auto-parsed dose after route selection:", result.data);
 
         // Force a form validation check to update the UI
         form.trigger("doseString");
-      } catch (error) {
-        console.log("Could not auto-parse after route selection:", error);
+      } else {
+        console.log("Could not auto-parse after route selection:", result.error);
       }
     } else {
       // Fallback for other cases
@@ -562,12 +562,7 @@ export function DoseHistory() {
     }
   };
 
-  const filteredDoses = doses.filter(
-    (dose) =>
-      selectedSubstances.includes(dose.substance) &&
-      selectedRoutes.includes(dose.route),
-  );
-
+  // Expects doses already sorted newest first; each group keeps that order
   const groupDoses = (doses: DoseEntry[]): GroupedDoses => {
     if (groupBy === "substance") {
       const groups = doses.reduce((groups: GroupedDoses, dose) => {
@@ -577,14 +572,6 @@ export function DoseHistory() {
         return groups;
       }, {});
 
-      // Sort doses within each group by timestamp, newest first
-      Object.keys(groups).forEach((key) => {
-        groups[key].sort(
-          (a, b) =>
-            new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-        );
-      });
-
       return groups;
     }
 
@@ -596,14 +583,6 @@ export function DoseHistory() {
         return groups;
       }, {});
 
-      // Sort doses within each group by timestamp, newest first
-      Object.keys(groups).forEach((key) => {
-        groups[key].sort(
-          (a, b) =>
-            new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-        );
-      });
-
       return groups;
     }
 
@@ -625,24 +604,28 @@ export function DoseHistory() {
       return groups;
     }, {});
 
-    // Sort doses within each group by timestamp, newest first
-    Object.keys(groups).forEach((key) => {
-      groups[key].sort(
-        (a, b) =>
-          new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-      );
-    });
-
     return groups;
   };
 
-  // Sort and group doses
+  // Filter and sort in one memoized step so the list is only rebuilt when the
+  // doses or the selection change, not on every render
   const sortedAndFilteredDoses = useMemo(() => {
-    return filteredDoses.sort(
-      (a, b) =>
-        new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-    );
-  }, [filteredDoses]);
+    // Hash-set membership keeps the filter O(1) per dose regardless of how many
+    // substances and routes are selected
+    const selectedSubstanceSet = new Set(selectedSubstances);
+    const selectedRouteSet = new Set(selectedRoutes);
+
+    return doses
+      .filter(
+        (dose) =>
+          selectedSubstanceSet.has(dose.substance) &&
+          selectedRouteSet.has(dose.route),
+      )
+      .sort(
+        (a, b) =>
+          new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
+      );
+  }, [doses, selectedSubstances, selectedRoutes]);
 
   const sortedGroupEntries = useMemo<Array<[string, DoseEntry[]]>>(() => {
     const groups = groupDoses(sortedAndFilteredDoses);
@@ -681,7 +664,7 @@ export function DoseHistory() {
   // Log count information for debugging
   useEffect(() => {
     console.log("Total doses:", doses.length);
-    console.log("Filtered doses:", filteredDoses.length);
+    console.log("Filtered doses:", sortedAndFilteredDoses.length);
     console.log(
       "Active tab count:",
       sortedGroupEntries.reduce(
@@ -689,7 +672,7 @@ export function DoseHistory() {
         0,
       ),
     );
-  }, [doses, filteredDoses, sortedGroupEntries]);
+  }, [doses, sortedAndFilteredDoses, sortedGroupEntries]);
 
   if (loading) {
     return (
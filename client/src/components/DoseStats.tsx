@@ -843,22 +843,32 @@ const SubstanceExplorer = ({ doseData, personalPatterns }) => {
 
   // Get list of all substances
   const substances = useMemo(() => {
-    const uniqueSubstances = [
-      ...new Set(doseData.map((dose) => dose.substance)),
-    ];
-    return uniqueSubstances
-      .map((substance) => {
-        const doses = doseData.filter((dose) => dose.substance === substance);
+    // Count doses and track the latest one per substance in a single pass,
+    // rather than filtering and sorting the whole history once per substance
+    const summaries = new Map();
+    doseData.forEach((dose) => {
+      const time = new Date(dose.timestamp).getTime();
+      const summary = summaries.get(dose.substance);
+      if (!summary) {
+        summaries.set(dose.substance, { count: 1, lastDose: dose, lastTime: time });
+      } else {
+        summary.count += 1;
+        if (time > summary.lastTime) {
+          summary.lastDose = dose;
+          summary.lastTime = time;
+        }
+      }
+    });
+
+    return Array.from(summaries.entries())
+      .map(([substance, summary]) => {
         const pattern = personalPatterns.find((p) => p.substance === substance);
 
         return {
           name: substance,
           color: getSubstanceColor(substance, isDarkMode),
-          count: doses.length,
-          lastDose: doses.sort(
-            (a, b) =>
-              new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-          )[0],
+          count: summary.count,
+          lastDose: summary.lastDose,
           pattern,
         };
       })
@@ -1238,28 +1248,32 @@ export function DoseStats() {
     // Unique substances
     const uniqueSubstances = [...new Set(doses.map((d) => d.substance))];
 
-    // Most used substance
+    // Tally substances and routes together in a single pass over the doses
     const substanceCounts = {};
+    const routeCounts = {};
     doses.forEach((dose) => {
       substanceCounts[dose.substance] =
         (substanceCounts[dose.substance] || 0) + 1;
+      routeCounts[dose.route] = (routeCounts[dose.route] || 0) + 1;
     });
+
+    // Most used substance
     const mostUsedSubstance = Object.entries(substanceCounts).sort(
       (a, b) => b[1] - a[1],
     )[0];
 
-    // Most recent dose
-    const sortedDoses = [...doses].sort(
-      (a, b) =>
-        new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-    );
-    const mostRecentDose = sortedDoses[0];
-
-    // Route distribution
-    const routeCounts = {};
+    // Most recent dose - a single max scan, no need to copy and sort everything
+    let mostRecentDose = doses[0];
+    let mostRecentTime = new Date(doses[0].timestamp).getTime();
     doses.forEach((dose) => {
-      routeCounts[dose.route] = (routeCounts[dose.route] || 0) + 1;
+      const time = new Date(dose.timestamp).getTime();
+      if (time > mostRecentTime) {
+        mostRecentDose = dose;
+        mostRecentTime = time;
+      }
     });
+
+    // Route distribution
     const routeDistribution = Object.entries(routeCounts)
       .map(([route, count]) => ({ name: route, value: count }))
       .sort((a, b) => b.value - a.value);
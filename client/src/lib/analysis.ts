@@ -84,15 +84,18 @@ export function calculateTimeCorrelations(
     for (let j = i + 1; j < substances.length; j++) {
       const substance1 = substances[i];
       const substance2 = substances[j];
-      const days1 = Array.from(substanceDays.get(substance1) || []);
-      const days2 = Array.from(substanceDays.get(substance2) || []);
-
-
-      const commonDays = days1.filter((day) => days2.indexOf(day) !== -1).length;
-      const totalDays = new Set([...days1, ...days2]).size;
+      const days1 = substanceDays.get(substance1) || new Set<string>();
+      const days2 = substanceDays.get(substance2) || new Set<string>();
+
+      // Probe the other substance's day set directly instead of copying both
+      // sets to arrays and scanning one with indexOf for every day
+      let commonDays = 0;
+      days1.forEach((day) => {
+        if (days2.has(day)) commonDays++;
+      });
 
 
-      const correlation = commonDays / Math.sqrt(days1.length * days2.length);
+      const correlation = commonDays / Math.sqrt(days1.size * days2.size);
 
       correlations.push({
         substance1,
@@ -148,10 +151,7 @@ export function analyzePersonalPatterns(
   });
 
   return Array.from(substanceDoses.entries()).map(([substance, doses]) => {
-    const sortedDoses = doses.sort(
-      (a, b) =>
-        new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-    );
+    const sortedDoses = sortByTimestamp(doses, "desc");
 
 
     const timeBetweenDoses = sortedDoses
@@ -165,8 +165,7 @@ export function analyzePersonalPatterns(
 
 
     const amounts = sortedDoses.map((d) => d.amount);
-    const avgAmount =
-      amounts.reduce((sum, amt) => sum + amt, 0) / amounts.length;
+    const avgAmount = average(amounts);
 
 
     let consecutiveDays = 0;
@@ -210,53 +209,49 @@ export function analyzePersonalPatterns(
       const hour = new Date(dose.timestamp).getHours();
       hourCounts.set(hour, (hourCounts.get(hour) || 0) + 1);
     });
-    const commonHour = Array.from(hourCounts.entries()).sort(
-      (a, b) => b[1] - a[1],
-    )[0][0];
+    const [commonHour] = mostFrequent(hourCounts);
 
 
     const routeCounts = new Map<string, number>();
     sortedDoses.forEach((dose) => {
       routeCounts.set(dose.route, (routeCounts.get(dose.route) || 0) + 1);
     });
-    const preferredRoute = Array.from(routeCounts.entries()).sort(
-      (a, b) => b[1] - a[1],
-    )[0][0];
+    const [preferredRoute, preferredRouteCount] = mostFrequent(routeCounts);
 
 
     const recentDoses = sortedDoses.slice(0, Math.min(10, sortedDoses.length));
     const olderDoses = sortedDoses.slice(Math.min(10, sortedDoses.length));
 
-    const recentAvg =
-      recentDoses.reduce((sum, d) => sum + d.amount, 0) / recentDoses.length;
+    // amounts is in the same order as sortedDoses, so average index ranges of it
+    // directly instead of re-reading each dose object or copying sub-arrays
+    const recentAvg = average(amounts, 0, recentDoses.length);
     const olderAvg = olderDoses.length
-      ? olderDoses.reduce((sum, d) => sum + d.amount, 0) / olderDoses.length
+      ? average(amounts, recentDoses.length)
       : recentAvg;
 
     const doseSizeTrend = olderAvg ? (recentAvg - olderAvg) / olderAvg : 0;
 
 
     const now = new Date();
-    const lastWeekDoses = sortedDoses.filter(
-      (d) => differenceInDays(now, new Date(d.timestamp)) <= 7,
-    ).length;
-    const previousWeekDoses = sortedDoses.filter(
-      (d) =>
-        differenceInDays(now, new Date(d.timestamp)) > 7 &&
-        differenceInDays(now, new Date(d.timestamp)) <= 14,
-    ).length;
+
+    // Bucket every dose by age in a single pass instead of re-parsing each
+    // timestamp once per window
+    let lastWeekDoses = 0;
+    let previousWeekDoses = 0;
+    let lastMonthDoses = 0;
+    let previousMonthDoses = 0;
+    sortedDoses.forEach((d) => {
+      const daysAgo = differenceInDays(now, new Date(d.timestamp));
+      if (daysAgo <= 7) lastWeekDoses++;
+      else if (daysAgo <= 14) previousWeekDoses++;
+      if (daysAgo <= 30) lastMonthDoses++;
+      else if (daysAgo <= 60) previousMonthDoses++;
+    });
+
     const weekOverWeekChange = previousWeekDoses
       ? (lastWeekDoses - previousWeekDoses) / previousWeekDoses
       : 0;
 
-    const lastMonthDoses = sortedDoses.filter(
-      (d) => differenceInDays(now, new Date(d.timestamp)) <= 30,
-    ).length;
-    const previousMonthDoses = sortedDoses.filter(
-      (d) =>
-        differenceInDays(now, new Date(d.timestamp)) > 30 &&
-        differenceInDays(now, new Date(d.timestamp)) <= 60,
-    ).length;
     const monthOverMonthChange = previousMonthDoses
       ? (lastMonthDoses - previousMonthDoses) / previousMonthDoses
       : 0;
@@ -285,8 +280,7 @@ export function analyzePersonalPatterns(
         ? 1 -
           standardDeviation(timeBetweenDoses) / (average(timeBetweenDoses) || 1)
         : 1;
-    const routeConsistency =
-      Math.max(...Array.from(routeCounts.values())) / sortedDoses.length;
+    const routeConsistency = preferredRouteCount / sortedDoses.length;
 
     return {
       substance,
@@ -319,16 +313,67 @@ export function analyzePersonalPatterns(
 }
 
 
-function average(numbers: number[]): number {
-  return numbers.length
-    ? numbers.reduce((sum, n) => sum + n, 0) / numbers.length
-    : 0;
+// Plain indexed loops keep these reductions monomorphic and allocation-free;
+// they run once per substance for every stats refresh.
+// Averages numbers[start..end); defaults to the whole array
+function average(
+  numbers: number[],
+  start: number = 0,
+  end: number = numbers.length,
+): number {
+  if (end <= start) return 0;
+  let sum = 0;
+  for (let i = start; i < end; i++) {
+    sum += numbers[i];
+  }
+  return sum / (end - start);
 }
 
 function standardDeviation(numbers: number[]): number {
+  if (!numbers.length) return 0;
   const avg = average(numbers);
-  const squareDiffs = numbers.map((n) => Math.pow(n - avg, 2));
-  return Math.sqrt(average(squareDiffs));
+  let sumSquares = 0;
+  for (let i = 0; i < numbers.length; i++) {
+    const diff = numbers[i] - avg;
+    sumSquares += diff * diff;
+  }
+  return Math.sqrt(sumSquares / numbers.length);
+}
+
+// Returns the entry with the highest count in a single scan rather than sorting
+// all entries to take the first. Ties go to the earliest inserted key, matching
+// what the previous stable sort returned.
+function mostFrequent<K>(counts: Map<K, number>): [K, number] {
+  let bestKey: K | undefined;
+  let bestCount = -Infinity;
+  counts.forEach((count, key) => {
+    if (count > bestCount) {
+      bestKey = key;
+      bestCount = count;
+    }
+  });
+  return [bestKey as K, bestCount];
+}
+
+// Sorts doses in place by timestamp. Timestamps are parsed once into a parallel
+// array instead of twice per comparison inside the comparator.
+function sortByTimestamp(
+  doses: DoseEntry[],
+  order: "asc" | "desc",
+): DoseEntry[] {
+  const times = doses.map((dose) => new Date(dose.timestamp).getTime());
+  const indices = doses.map((_, i) => i);
+  indices.sort(
+    order === "asc"
+      ? (a, b) => times[a] - times[b]
+      : (a, b) => times[b] - times[a],
+  );
+
+  const sorted = indices.map((i) => doses[i]);
+  for (let i = 0; i < sorted.length; i++) {
+    doses[i] = sorted[i];
+  }
+  return doses;
 }
 
 
@@ -371,10 +416,7 @@ export function analyzeUsagePatterns(doses: DoseEntry[]): UsagePattern[] {
     if (substanceDoses.length < 2) return;
 
 
-    const sortedDoses = substanceDoses.sort(
-      (a, b) =>
-        new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime(),
-    );
+    const sortedDoses = sortByTimestamp(substanceDoses, "asc");
 
 
     const gaps = [];
@@ -388,11 +430,8 @@ export function analyzeUsagePatterns(doses: DoseEntry[]): UsagePattern[] {
     }
 
 
-    const avgGap = gaps.reduce((sum, gap) => sum + gap, 0) / gaps.length;
-    const variance =
-      gaps.reduce((sum, gap) => sum + Math.pow(gap - avgGap, 2), 0) /
-      gaps.length;
-    const stdDev = Math.sqrt(variance);
+    const avgGap = average(gaps);
+    const stdDev = standardDeviation(gaps);
     const coefficientOfVariation = stdDev / avgGap;
     const consistency = Math.max(0, Math.min(1, 1 - coefficientOfVariation));
 
@@ -436,10 +475,7 @@ export function generateUsageForecast(
     if (substanceDoses.length < 5) return;
 
 
-    const sortedDoses = substanceDoses.sort(
-      (a, b) =>
-        new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime(),
-    );
+    const sortedDoses = sortByTimestamp(substanceDoses, "asc");
     const firstDoseTime = new Date(sortedDoses[0].timestamp).getTime();
 
     const data = sortedDoses.map((dose) => [
@@ -503,9 +539,7 @@ export function analyzeSubstanceInteractions(
   doses: DoseEntry[],
 ): SubstanceInteraction[] {
   const interactions: SubstanceInteraction[] = [];
-  const recentDoses = doses.sort(
-    (a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-  );
+  const recentDoses = sortByTimestamp(doses, "desc");
 
 
   const combinations = new Map<string, { count: number; minGap: number }>();
@@ -608,9 +642,7 @@ export function generateCalendarData(doses: DoseEntry[]) {
 
 export function calculateRecoveryPeriods(doses: DoseEntry[]) {
   const substanceRecovery = new Map<string, number>();
-  const recentDoses = doses.sort(
-    (a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime(),
-  );
+  const recentDoses = sortByTimestamp(doses, "desc");
 
   recentDoses.forEach((dose) => {
     const prevRecovery = substanceRecovery.get(dose.substance) || 0;
@@ -17,12 +17,24 @@ export const ADMINISTRATION_METHODS = {
   ]
 } as const;
 
-export const ROUTE_ALIASES = Object.entries(ADMINISTRATION_METHODS).reduce(
-  (acc, [standard, aliases]) => {
-    aliases.forEach(alias => { acc[alias] = standard; });
-    return acc;
-  },
-  {} as Record<string, string>
+// Frozen: built once at load and shared by the parser, the dose forms and
+// server/routes.ts, so it must never be mutated
+export const ROUTE_ALIASES: Readonly<Record<string, string>> = Object.freeze(
+  Object.entries(ADMINISTRATION_METHODS).reduce(
+    (acc, [standard, aliases]) => {
+      aliases.forEach(alias => { acc[alias] = standard; });
+      return acc;
+    },
+    {} as Record<string, string>
+  )
+);
+
+// Lower-cased route names, excluding @verb commands, for exact-match checks
+export const ROUTE_NAME_SET: ReadonlySet<string> = new Set(
+  Object.values(ADMINISTRATION_METHODS)
+    .flat()
+    .filter((r) => !r.startsWith("@"))
+    .map((r) => r.toLowerCase()),
 );
 
 export const UNITS = ["mg", "g", "ug", "ml"] as const;
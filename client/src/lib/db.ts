@@ -113,9 +113,11 @@ export async function addDose(dose: Omit<DoseEntry, "id" | "timestamp">) {
 }
 
 // Helper function to ensure a dose has a notes array
+// Doses read from IndexedDB are fresh structured clones owned by the caller, so the
+// array is filled in place rather than copying every record into a new object
 function ensureNotesArray(dose: DoseEntry): DoseEntry {
   if (!dose.notes) {
-    return { ...dose, notes: [] };
+    dose.notes = [];
   }
   return dose;
 }
@@ -163,10 +165,10 @@ export async function getAllDosesForStats(): Promise<DoseEntry[]> {
     );
 
     // Ensure notes array exists for all doses
-    const dosesWithNotes = allDoses.map(ensureNotesArray);
+    allDoses.forEach(ensureNotesArray);
 
-    console.log(`Loaded ${dosesWithNotes.length} doses for statistics`);
-    return dosesWithNotes;
+    console.log(`Loaded ${allDoses.length} doses for statistics`);
+    return allDoses;
   } catch (error) {
     console.error("Error fetching all doses for stats:", error);
     return [];
@@ -233,14 +235,21 @@ export async function getDosesByDateRange(
   limit: number = 50,
   offset: number = 0,
 ): Promise<{ doses: DoseEntry[]; total: number }> {
-  const db = await getDB();
-  const allDoses = await db.getAllFromIndex("doses", "by-date");
   const startIso = startDate.toISOString();
   const endIso = endDate.toISOString();
 
-  // Filter doses in the date range
-  const filteredDoses = allDoses.filter(
-    (dose) => dose.timestamp >= startIso && dose.timestamp <= endIso,
+  // IDBKeyRange.bound throws on an inverted range; nothing can match it anyway
+  if (startIso > endIso) {
+    return { doses: [], total: 0 };
+  }
+
+  // Let the by-date index seek straight to the range instead of loading every
+  // dose and filtering in JS. Index keys compare the same way as the ISO strings.
+  const db = await getDB();
+  const filteredDoses = await db.getAllFromIndex(
+    "doses",
+    "by-date",
+    IDBKeyRange.bound(startIso, endIso),
   );
 
   // Sort the doses by timestamp (newest first)
@@ -7,40 +7,205 @@ export class DoseParsingError extends Error {
   }
 }
 
+export type DoseParseResult =
+  | { success: true; data: Omit<DoseEntry, "id" | "timestamp"> }
+  | { success: false; error: string };
+
+function failure(error: string): DoseParseResult {
+  return { success: false, error };
+}
+
+// Lookup table of conversions to the stored unit: amount * multiply / divide.
+// Multiplier and divisor are kept apart so results stay identical to a plain
+// `/ 1000` or `* 1000` (multiplying by 0.001 rounds differently).
 const UNIT_CONVERSIONS = {
-  ug: (amount: number) => ({ amount: amount / 1000, unit: "mg" as const }),
-  g: (amount: number) => ({ amount: amount * 1000, unit: "mg" as const }),
-  mg: (amount: number) => ({ amount, unit: "mg" as const }),
-  ml: (amount: number) => ({ amount, unit: "ml" as const }),
-};
+  ug: { unit: "mg", multiply: 1, divide: 1000 },
+  g: { unit: "mg", multiply: 1000, divide: 1 },
+  mg: { unit: "mg", multiply: 1, divide: 1 },
+  ml: { unit: "ml", multiply: 1, divide: 1 },
+} as const;
+
+// Hand-written scanners for the two dose formats. The grammar is small enough that a
+// single left-to-right pass beats running it through a regex engine:
+//   standard: <amount><unit> <substance...> <route>   e.g. "20mg diazepam oral"
+//   verb:     @<verb> <amount><unit> <substance...>   e.g. "@ate 30mg 3-meo-pcp"
+// Substance names may contain letters, digits, underscores, dashes, commas, periods,
+// slashes, parentheses and spaces; routes and verbs are single words.
+const UNIT_SET: ReadonlySet<string> = new Set(UNITS);
+
+// Character classes work on UTF-16 code units from charCodeAt, so the scan compares
+// small integers and never creates a one-character string per position.
+// Out-of-range reads give NaN, which fails every test below.
+const CHAR_TAB = 0x09;
+const CHAR_CR = 0x0d;
+const CHAR_SPACE = 0x20;
+const CHAR_OPEN_PAREN = 0x28;
+const CHAR_CLOSE_PAREN = 0x29;
+const CHAR_COMMA = 0x2c;
+const CHAR_DASH = 0x2d;
+const CHAR_DOT = 0x2e;
+const CHAR_SLASH = 0x2f;
+const CHAR_0 = 0x30;
+const CHAR_9 = 0x39;
+const CHAR_AT = 0x40;
+const CHAR_UPPER_A = 0x41;
+const CHAR_UPPER_Z = 0x5a;
+const CHAR_UNDERSCORE = 0x5f;
+const CHAR_LOWER_A = 0x61;
+const CHAR_LOWER_Z = 0x7a;
+
+// Mirrors the regex \s class so inputs are split exactly as before
+function isSpace(c: number): boolean {
+  return (
+    c === CHAR_SPACE ||
+    (c >= CHAR_TAB && c <= CHAR_CR) ||
+    c === 0x00a0 ||
+    c === 0x1680 ||
+    (c >= 0x2000 && c <= 0x200a) ||
+    c === 0x2028 ||
+    c === 0x2029 ||
+    c === 0x202f ||
+    c === 0x205f ||
+    c === 0x3000 ||
+    c === 0xfeff
+  );
+}
+
+function isDigit(c: number): boolean {
+  return c >= CHAR_0 && c <= CHAR_9;
+}
+
+function isWordChar(c: number): boolean {
+  return (
+    (c >= CHAR_LOWER_A && c <= CHAR_LOWER_Z) ||
+    (c >= CHAR_UPPER_A && c <= CHAR_UPPER_Z) ||
+    isDigit(c) ||
+    c === CHAR_UNDERSCORE
+  );
+}
+
+function isSubstanceChar(c: number): boolean {
+  return (
+    isWordChar(c) ||
+    isSpace(c) ||
+    // "," "-" "." "/" are contiguous code points
+    (c >= CHAR_COMMA && c <= CHAR_SLASH) ||
+    c === CHAR_OPEN_PAREN ||
+    c === CHAR_CLOSE_PAREN
+  );
+}
+
+function isRouteChar(c: number): boolean {
+  return isWordChar(c) || c === CHAR_DASH;
+}
+
+function allChars(s: string, start: number, end: number, test: (c: number) => boolean) {
+  for (let i = start; i < end; i++) {
+    if (!test(s.charCodeAt(i))) return false;
+  }
+  return true;
+}
+
+// Scans "<amount>[ ]<unit>" starting at `start`. Returns the raw amount, the unit and the
+// index just past the unit, or null if it doesn't fit. The unit must be followed by a space.
+function scanAmountAndUnit(
+  s: string,
+  start: number,
+): [amount: string, unit: string, end: number] | null {
+  let i = start;
+  while (i < s.length && isDigit(s.charCodeAt(i))) i++;
+  if (i === start) return null;
+  if (s.charCodeAt(i) === CHAR_DOT) {
+    i++;
+    while (i < s.length && isDigit(s.charCodeAt(i))) i++;
+  }
+  const amount = s.slice(start, i);
+
+  while (i < s.length && isSpace(s.charCodeAt(i))) i++;
+  const unitStart = i;
+  while (i < s.length && !isSpace(s.charCodeAt(i))) i++;
+  const unit = s.slice(unitStart, i);
+  if (i === s.length || !UNIT_SET.has(unit)) return null;
+
+  return [amount, unit, i];
+}
+
+// Expects a trimmed, lower-cased string
+function scanStandard(
+  s: string,
+): [amount: string, unit: string, substance: string, route: string] | null {
+  const head = scanAmountAndUnit(s, 0);
+  if (!head) return null;
+  const [amount, unit, unitEnd] = head;
+
+  // The route is the last word; everything between the unit and the route is the
+  // substance. That gap starts and ends with a space, and since spaces are valid
+  // substance characters it only needs one more character of any allowed kind.
+  let routeStart = s.length;
+  while (routeStart > unitEnd && !isSpace(s.charCodeAt(routeStart - 1))) routeStart--;
+  if (routeStart - unitEnd < 3) return null;
+  if (!allChars(s, routeStart, s.length, isRouteChar)) return null;
+  if (!allChars(s, unitEnd, routeStart, isSubstanceChar)) return null;
+
+  return [amount, unit, s.slice(unitEnd, routeStart), s.slice(routeStart)];
+}
+
+// Expects a trimmed, lower-cased string
+function scanVerb(
+  s: string,
+): [verb: string, amount: string, unit: string, substance: string] | null {
+  if (s.charCodeAt(0) !== CHAR_AT) return null;
+  let i = 1;
+  while (i < s.length && isWordChar(s.charCodeAt(i))) i++;
+  if (i === 1) return null;
+  const verb = s.slice(0, i);
+
+  const verbEnd = i;
+  while (i < s.length && isSpace(s.charCodeAt(i))) i++;
+  if (i === verbEnd) return null;
+
+  const rest = scanAmountAndUnit(s, i);
+  if (!rest) return null;
+  const [amount, unit, unitEnd] = rest;
+  if (!allChars(s, unitEnd, s.length, isSubstanceChar)) return null;
+
+  return [verb, amount, unit, s.slice(unitEnd)];
+}
+
+// Alias lists used for fuzzy matching and error messages, built once
+const ROUTE_ALIAS_KEYS = Object.keys(ROUTE_ALIASES);
+const VERB_COMMANDS = ROUTE_ALIAS_KEYS.filter((r) => r.startsWith("@"));
 
 const MAX_REASONABLE_DOSE = 100000; // 10g in mg
 const MIN_REASONABLE_DOSE = 0.001; // 1ug in mg
 
-export function parseDoseString(
-  doseString: string,
-): Omit<DoseEntry, "id" | "timestamp"> {
-  if (!doseString?.trim()) {
-    throw new DoseParsingError("Dose string cannot be empty");
+/**
+ * Parse a dose string without throwing. Failures come back as a value, which keeps
+ * exception construction off hot paths such as the per-keystroke preview in DoseForm.
+ */
+export function safeParseDoseString(doseString: string): DoseParseResult {
+  const trimmed = doseString?.trim();
+  if (!trimmed) {
+    return failure("Dose string cannot be empty");
   }
 
-  // Define regex patterns - allow more complex substance names with abbreviated names, numbers, dashes, commas, periods
-  // Improved patterns with more strict checking for amount+unit and more flexible substance names
-  const standardPattern = /^(\d+\.?\d*)\s*(mg|ug|g|ml)\s+([\w\d\-\,\.\s\/\(\)]+?)\s+([\w\-]+)$/i;
-  const verbPattern = /^(@\w+)\s+(\d+\.?\d*)\s*(mg|ug|g|ml)\s+([\w\d\-\,\.\s\/\(\)]+?)$/i;
-
-  const cleanString = doseString.trim().toLowerCase();
-  let match = standardPattern.exec(cleanString);
+  const cleanString = trimmed.toLowerCase();
+  // The first character decides the format ("@" for verbs, a digit otherwise), so
+  // only one scanner ever runs
+  const isVerbFormat = cleanString[0] === "@";
+  const standardMatch = isVerbFormat ? null : scanStandard(cleanString);
 
   let amount: number;
   let unit: (typeof UNITS)[number];
   let substance: string;
   let route: string;
+  // The canonical route, resolved with a single alias lookup per branch
+  let standardRoute: string;
 
-  if (match) {
+  if (standardMatch) {
     let amountStr;
     let unitStr;
-    [, amountStr, unitStr, substance, route] = match;
+    [amountStr, unitStr, substance, route] = standardMatch;
     amount = parseFloat(amountStr);
     unit = unitStr as (typeof UNITS)[number];
     substance = substance.trim(); // Trim any extra spaces
@@ -49,29 +214,30 @@ export function parseDoseString(
     route = route.toLowerCase().trim();
     
     // If route is not found, try to find a close match
-    if (!ROUTE_ALIASES[route]) {
+    standardRoute = ROUTE_ALIASES[route];
+    if (!standardRoute) {
       // Try to find the closest route by checking if any valid route contains this string
-      const closestRoute = Object.keys(ROUTE_ALIASES).find(r => 
+      const closestRoute = ROUTE_ALIAS_KEYS.find(r => 
         r.toLowerCase().includes(route) || route.includes(r.toLowerCase())
       );
       
       if (closestRoute) {
         // Use the closest match
-        route = closestRoute;
+        standardRoute = ROUTE_ALIASES[closestRoute];
       } else {
         // Provide helpful error message with common routes
         const commonRoutes = ["oral", "nasal", "smoked", "IV", "IM", "rectal", "sublingual"];
-        throw new DoseParsingError(
+        return failure(
           `Unknown route of administration: ${route}\n` +
           `Common routes are: ${commonRoutes.join(", ")}\n` +
-          `Full list: ${Object.keys(ROUTE_ALIASES).slice(0, 15).join(", ")}...`,
+          `Full list: ${ROUTE_ALIAS_KEYS.slice(0, 15).join(", ")}...`,
         );
       }
     }
   } else {
-    match = verbPattern.exec(cleanString);
-    if (!match) {
-      throw new DoseParsingError(
+    const verbMatch = isVerbFormat ? scanVerb(cleanString) : null;
+    if (!verbMatch) {
+      return failure(
         "Invalid dose format. Examples:\n" +
           "• 20mg diazepam oral\n" +
           "• 5ml 2m2b oral\n" + 
@@ -80,103 +246,109 @@ export function parseDoseString(
       );
     }
 
-    const [, rawVerb, amt, u, subst] = match;
+    const [rawVerb, amt, u, subst] = verbMatch;
     amount = parseFloat(amt);
     unit = u as (typeof UNITS)[number];
     substance = subst.trim(); // Trim any extra spaces
     
     // Normalize and validate verb
-    let normalizedVerb = rawVerb.toLowerCase().trim();
+    const normalizedVerb = rawVerb.toLowerCase().trim();
     
-    if (!ROUTE_ALIASES[normalizedVerb]) {
+    standardRoute = ROUTE_ALIASES[normalizedVerb];
+    if (!standardRoute) {
       // Check if it's a malformed @ command
       if (normalizedVerb.startsWith('@')) {
         // Try to find a close match among @ commands
-        const verbCommands = Object.keys(ROUTE_ALIASES).filter(r => r.startsWith('@'));
-        const closestVerb = verbCommands.find(v => 
+        const closestVerb = VERB_COMMANDS.find(v => 
           v.slice(1).includes(normalizedVerb.slice(1)) || normalizedVerb.slice(1).includes(v.slice(1))
         );
         
         if (closestVerb) {
           // Use the closest match
-          normalizedVerb = closestVerb;
+          standardRoute = ROUTE_ALIASES[closestVerb];
         } else {
-          throw new DoseParsingError(
+          return failure(
             `Unknown verb command: ${normalizedVerb}\n` +
-            `Valid verbs: ${Object.keys(ROUTE_ALIASES)
-              .filter((r) => r.startsWith("@"))
-              .join(", ")}`,
+            `Valid verbs: ${VERB_COMMANDS.join(", ")}`,
           );
         }
       } else {
-        throw new DoseParsingError(
+        return failure(
           `Unknown verb command: ${normalizedVerb}\n` +
-          `Valid verbs: ${Object.keys(ROUTE_ALIASES)
-            .filter((r) => r.startsWith("@"))
-            .join(", ")}`,
+          `Valid verbs: ${VERB_COMMANDS.join(", ")}`,
         );
       }
     }
-    
-    // Set the route to the normalized verb
-    route = normalizedVerb;
   }
 
   // Validate amount with more thorough checks
   amount = parseFloat(amount as unknown as string);
   if (isNaN(amount)) {
-    throw new DoseParsingError("Amount must be a number");
+    return failure("Amount must be a number");
   }
   if (amount <= 0) {
-    throw new DoseParsingError("Amount must be greater than 0");
+    return failure("Amount must be greater than 0");
   }
   
   // Prevent unreasonably large values right away before unit conversion
   if (amount > 1000000) {
-    throw new DoseParsingError(`Dose amount is unreasonably high (${amount}). Please check your input.`);
+    return failure(`Dose amount is unreasonably high (${amount}). Please check your input.`);
   }
 
   // Make sure the unit is valid before attempting conversion
   unit = unit.toLowerCase() as (typeof UNITS)[number];
   if (!UNITS.includes(unit as any)) {
-    throw new DoseParsingError(
+    return failure(
       `Invalid unit: ${unit}. Valid units are: ${UNITS.join(', ')}`
     );
   }
 
   // Convert units and validate reasonable ranges
-  const conversion =
-    UNIT_CONVERSIONS[unit as keyof typeof UNIT_CONVERSIONS]?.(amount);
-  if (!conversion) {
-    throw new DoseParsingError(`Invalid unit: ${unit}`);
+  const scale = UNIT_CONVERSIONS[unit as keyof typeof UNIT_CONVERSIONS];
+  if (!scale) {
+    return failure(`Invalid unit: ${unit}`);
   }
+  const convertedAmount = (amount * scale.multiply) / scale.divide;
 
   // Validate converted amount is within reasonable range
-  if (conversion.unit === "mg" && conversion.amount > MAX_REASONABLE_DOSE) {
-    throw new DoseParsingError(
-      `Dose seems unusually high (${conversion.amount}mg). ` +
+  if (scale.unit === "mg" && convertedAmount > MAX_REASONABLE_DOSE) {
+    return failure(
+      `Dose seems unusually high (${convertedAmount}mg). ` +
         `Please verify the amount and units.`,
     );
   }
-  if (conversion.unit === "mg" && conversion.amount < MIN_REASONABLE_DOSE) {
-    throw new DoseParsingError(
-      `Dose seems unusually low (${conversion.amount}mg). ` +
+  if (scale.unit === "mg" && convertedAmount < MIN_REASONABLE_DOSE) {
+    return failure(
+      `Dose seems unusually low (${convertedAmount}mg). ` +
         `Please verify the amount and units.`,
     );
   }
 
   // Validate substance name
   if (substance.length < 2) {
-    throw new DoseParsingError("Substance name is too short");
+    return failure("Substance name is too short");
   }
   if (substance.length > 50) {
-    throw new DoseParsingError("Substance name is too long");
+    return failure("Substance name is too long");
   }
 
   return {
-    substance: substance.toLowerCase(),
-    amount: conversion.amount,
-    route: ROUTE_ALIASES[route],
-    unit: conversion.unit,
+    success: true,
+    data: {
+      substance: substance.toLowerCase(),
+      amount: convertedAmount,
+      route: standardRoute,
+      unit: scale.unit,
+    },
   };
 }
+
+export function parseDoseString(
+  doseString: string,
+): Omit<DoseEntry, "id" | "timestamp"> {
+  const result = safeParseDoseString(doseString);
+  if (!result.success) {
+    throw new DoseParsingError(result.error);
+  }
+  return result.data;
+}